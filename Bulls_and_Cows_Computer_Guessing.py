@@ -3,14 +3,80 @@ Bulls and Cows Game Solver using Information Theory
 This implementation uses entropy-based approach to make optimal guesses
 by maximizing information gain at each step of the game.
 '''
+import glob
+import hashlib
 import itertools
+import json
 import math
-from typing import List, Tuple, Dict
+import multiprocessing
+import operator
+import os
+import signal
+import sys
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# All 4-digit codes with unique digits, indexed by code id. Besides the digit
+# tuples, each code's first and last digit pairs (0-99) are kept in one byte
+# column per pair so whole columns can be processed by a single bytes call,
+# and its digits as a 10-bit mask with bit d set when digit d is present
+CODE_DIGITS = list(itertools.permutations(range(10), 4))
+NUM_CODES = len(CODE_DIGITS)
+DIGIT_MASKS = [(1 << a) | (1 << b) | (1 << c) | (1 << d) for a, b, c, d in CODE_DIGITS]
+FIRST_PAIRS = bytes([a * 10 + b for a, b, _, _ in CODE_DIGITS])
+LAST_PAIRS = bytes([c * 10 + d for _, _, c, d in CODE_DIGITS])
+
+# count * log2(count) for every group size up to the number of codes,
+# with 0 * log2(0) taken as 0
+WEIGHTED_LOG2 = [0.0] + [count * math.log2(count) for count in range(1, NUM_CODES + 1)]
+
+# Keys of the feedbacks that can actually occur: every (bulls, cows) with
+# bulls + cows <= 4, except (3, 1)
+POSSIBLE_FEEDBACK_KEYS = tuple(bulls * 5 + cows for bulls in range(5) for cows in range(5 - bulls)
+                               if (bulls, cows) != (3, 1))
+NUM_POSSIBLE_FEEDBACKS = len(POSSIBLE_FEEDBACK_KEYS)
+
+# Opening guess (code id 0, "0123") and its entropy. Relabelling digits and
+# permuting positions maps any guess onto any other while keeping the set of
+# all codes fixed, so every opening guess has this same entropy; the search
+# would pick the lowest id after ~5040 * 5040 table lookups.
+OPENING_GUESS = 0
+OPENING_ENTROPY = 2.7711521657550207
+
+# Candidate sets smaller than this are always searched in-process. Measured
+# on one core: an in-process search takes ~25ms at 64 codes, ~60ms at 256 and
+# ~275ms at 1440, while a submit/result round trip to a running forked worker
+# costs ~0.2ms. Each forked worker starts in ~4ms.
+PARALLEL_MIN_CODES = 256
+
+# Upper limit on search worker processes. A search is at most a few hundred
+# milliseconds of work, so more workers mostly add startup cost.
+MAX_SEARCH_WORKERS = 4
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache')
+
+# Best guesses found in earlier games, keyed by candidate_signature.
+# Bump the version whenever the search could pick a different guess,
+# including changes to how scores are computed or compared: guesses whose
+# entropies tie up to rounding are told apart by those float details. Other
+# versions are deleted on the next save.
+GUESS_CACHE_PATH = os.path.join(CACHE_DIR, 'bulls_and_cows_guesses_v1.json')
+
+# BLAKE2b digest of the table followed by the rows of build_feedback_table
+# stored back to back. Bump the version whenever the code order, the file
+# layout or feedback_key changes; other versions are deleted on the next save.
+FEEDBACK_TABLE_PATH = os.path.join(CACHE_DIR, 'bulls_and_cows_feedback_v1.bin')
+FEEDBACK_TABLE_DIGEST_SIZE = 16
 
 def compute_feedback(secret: str, guess: str) -> Tuple[int, int]:
     """
     Compute the feedback for a guess in terms of bulls and cows.
-    Uses a marking strategy to avoid double-counting digits.
+    Relies on the digits of each code being unique, so every shared digit
+    is counted once. The solver reads feedback from the precomputed table;
+    this direct computation is what is_valid_feedback_table checks a saved
+    table against.
     
     Args:
         secret (str): The secret code to be matched against
@@ -23,117 +89,511 @@ def compute_feedback(secret: str, guess: str) -> Tuple[int, int]:
             
     Example:
         >>> compute_feedback("1234", "1432")
-        (2, 2)  # 1,4 are bulls; 2,3 are cows
+        (2, 2)  # 1,3 are bulls; 2,4 are cows
     """
-    # Create copies of strings as lists to mark used digits
-    secret_digits = list(secret)
-    guess_digits = list(guess)
-    bulls = 0
-    cows = 0
-
-    # First count bulls
-    for i in range(4):
-        if guess_digits[i] == secret_digits[i]:
-            bulls += 1
-            # Mark matched positions with special characters to avoid reuse
-            secret_digits[i] = 'x'
-            guess_digits[i] = 'y'
+    # Count exact matches (bulls)
+    bulls = sum(s == g for s, g in zip(secret, guess))
 
-    # Then count cows (avoiding marked positions)
-    for i in range(4):
-        if guess_digits[i] != 'y' and guess_digits[i] in secret_digits:
-            cows += 1
-            # Mark the used digit in secret to avoid double counting
-            secret_digits[secret_digits.index(guess_digits[i])] = 'z'
+    # Shared digits are either bulls or cows
+    common = len(set(secret).intersection(guess))
+    return (bulls, common - bulls)
 
-    return (bulls, cows)
-
-def filter_codes(possible_codes: List[str], guess: str, bulls: int, cows: int) -> List[str]:
+def filter_codes(possible_ids: List[int], feedback_row: bytes, bulls: int, cows: int) -> List[int]:
     """
     Filter the possible codes based on the feedback received.
     Eliminates codes that wouldn't give the same feedback for the guess.
     
     Args:
-        possible_codes (List[str]): List of remaining possible secret codes
-        guess (str): The guess that was made
+        possible_ids (List[int]): Ids of the remaining possible secret codes
+        feedback_row (bytes): Row of the feedback table for the guess that was made
+        bulls (int): Number of bulls in the feedback
+        cows (int): Number of cows in the feedback
+        
+    Returns:
+        List[int]: Ids of the codes that remain possible
+        
+    Note:
+        The guess's feedback against every code is already in the table,
+        so filtering is a byte comparison per code.
+    """
+    key = feedback_key(bulls, cows)
+    return [code_id for code_id in possible_ids if feedback_row[code_id] == key]
+
+def feedback_key(bulls: int, cows: int) -> int:
+    """
+    Encode a (bulls, cows) feedback pair as a single small integer.
+    
+    Args:
         bulls (int): Number of bulls in the feedback
         cows (int): Number of cows in the feedback
         
     Returns:
-        List[str]: Filtered list of codes that remain possible
+        int: Encoded feedback (bulls * 5 + cows), from 0 to 20
+    """
+    return bulls * 5 + cows
+
+def format_code(code_id: int) -> str:
+    """
+    Convert a code id back to the 4-digit string shown to the player.
+    
+    Args:
+        code_id (int): Index of the code in CODE_DIGITS
+        
+    Returns:
+        str: The code as a string of digits
+        
+    Example:
+        >>> format_code(0)
+        '0123'
     """
-    filtered = []
-    for code in possible_codes:
-        b, c = compute_feedback(code, guess)
-        if b == bulls and c == cows:
-            filtered.append(code)
-    return filtered
+    return ''.join(map(str, CODE_DIGITS[code_id]))
 
-def calculate_entropy(possible_codes: List[str], guess: str) -> float:
+def build_feedback_table() -> List[bytes]:
+    """
+    Precompute the encoded feedback for every (guess, secret) pair.
+    Codes are referred to by their id, their index into CODE_DIGITS.
+    
+    Returns:
+        List[bytes]: table[guess_id][secret_id] is the feedback_key of that pair
+        
+    Note:
+        The table is built once per game, so every later entropy evaluation
+        is a byte lookup instead of a compute_feedback call. Since digits are
+        unique, each digit of a secret contributes independently to the key:
+        5 if it is a bull, 1 if it is a cow, 0 otherwise.
+        
+        A whole row is computed without a per-secret Python loop:
+        bytes.translate maps the FIRST_PAIRS and LAST_PAIRS columns to each
+        pair's summed score for the guess, and the two halves are added as big
+        integers, one byte per secret. No byte exceeds 20, so the addition
+        never carries between secrets.
+    """
+    padding = bytes(256 - 100)
+
+    feedback_table = []
+    for guess, guess_mask in zip(CODE_DIGITS, DIGIT_MASKS):
+        # Score of each digit 0-9 at each of the guess's positions; any other
+        # digit present in the guess is a cow
+        score0, score1, score2, score3 = (
+            [5 if digit == guess_digit else (guess_mask >> digit) & 1 for digit in range(10)]
+            for guess_digit in guess)
+
+        # Translation tables from a digit pair to its combined score
+        first_scores = bytes([x + y for x in score0 for y in score1]) + padding
+        last_scores = bytes([x + y for x in score2 for y in score3]) + padding
+
+        row = (int.from_bytes(FIRST_PAIRS.translate(first_scores), 'little') +
+               int.from_bytes(LAST_PAIRS.translate(last_scores), 'little'))
+        feedback_table.append(row.to_bytes(NUM_CODES, 'little'))
+    return feedback_table
+
+def write_cache_file(path: str, data: bytes) -> None:
+    """
+    Replace a cache file in one step, so an interrupted write never leaves
+    a partial file behind. Failing to write is not an error.
+    
+    Args:
+        path (str): Cache file to replace
+        data (bytes): New contents of the file
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, delete=False) as temp_file:
+            temp_file.write(data)
+    except OSError:
+        return
+    try:
+        os.replace(temp_file.name, path)
+    except OSError:
+        try:
+            os.remove(temp_file.name)
+        except OSError:
+            pass
+
+def remove_stale_cache_files(path: str) -> None:
+    """
+    Delete other versions of a cache file, named like path but with a
+    different "_v<version>" suffix. Failing to delete is not an error.
+    
+    Args:
+        path (str): Current version of the cache file, which is kept
+    """
+    stem = path.rsplit('_v', 1)[0]
+    for stale_path in glob.glob(glob.escape(stem) + '_v*'):
+        if stale_path != path:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass
+
+def is_valid_feedback_table(feedback_table: List[bytes]) -> bool:
+    """
+    Spot-check a feedback table against compute_feedback.
+    
+    Args:
+        feedback_table (List[bytes]): Table to check
+        
+    Returns:
+        bool: True if one entry of every row, at a secret id that varies from
+        row to row, matches compute_feedback
+    """
+    for guess_id, row in enumerate(feedback_table):
+        secret_id = (guess_id * 2017 + 1) % NUM_CODES
+        bulls, cows = compute_feedback(format_code(secret_id), format_code(guess_id))
+        if row[secret_id] != feedback_key(bulls, cows):
+            return False
+    return True
+
+def load_feedback_table() -> List[bytes]:
+    """
+    Load the feedback table saved by an earlier game, building and saving it
+    if no valid copy exists. Failing to save is not an error.
+    
+    Returns:
+        List[bytes]: Same table as build_feedback_table()
+        
+    Note:
+        A saved table is used only if it has the right size, matches the digest
+        stored with it, and passes is_valid_feedback_table. The digest catches
+        corrupted bytes, and the spot check catches a table that was written
+        intact but computed differently.
+    """
+    table_size = NUM_CODES * NUM_CODES
+    try:
+        with open(FEEDBACK_TABLE_PATH, 'rb') as table_file:
+            digest = table_file.read(FEEDBACK_TABLE_DIGEST_SIZE)
+            data = table_file.read()
+        if (len(data) == table_size and
+                hashlib.blake2b(data, digest_size=FEEDBACK_TABLE_DIGEST_SIZE).digest() == digest):
+            feedback_table = [data[start:start + NUM_CODES] for start in range(0, table_size, NUM_CODES)]
+            if is_valid_feedback_table(feedback_table):
+                return feedback_table
+    except OSError:
+        pass
+
+    feedback_table = build_feedback_table()
+    data = b''.join(feedback_table)
+    digest = hashlib.blake2b(data, digest_size=FEEDBACK_TABLE_DIGEST_SIZE).digest()
+    write_cache_file(FEEDBACK_TABLE_PATH, digest + data)
+    remove_stale_cache_files(FEEDBACK_TABLE_PATH)
+    return feedback_table
+
+def calculate_entropy(feedbacks: bytes) -> float:
     """
     Calculate the expected information gain (entropy) for a given guess.
     Uses Shannon entropy formula: -Σ P(x) * log₂(P(x))
     
     Args:
-        possible_codes (List[str]): List of remaining possible secret codes
-        guess (str): The guess to evaluate
+        feedbacks (bytes): Encoded feedback of the guess against each
+            remaining possible secret code
         
     Returns:
         float: Expected information gain in bits
         
     Note:
         Higher entropy indicates better guesses that will eliminate more possibilities
-        on average.
+        on average. With P(x) = c / n the formula is rewritten as
+        log₂(n) - Σ c * log₂(c) / n, so the logarithms come from WEIGHTED_LOG2.
     """
-    total_codes = len(possible_codes)
+    total_codes = len(feedbacks)
     if total_codes == 0:
         return 0.0
 
-    # Count frequency of each possible feedback
-    feedback_counts: Dict[Tuple[int, int], int] = {}
-    for code in possible_codes:
-        feedback = compute_feedback(code, guess)
-        feedback_counts[feedback] = feedback_counts.get(feedback, 0) + 1
+    # Count each reachable feedback key with bytes.count; keys without codes contribute 0
+    weighted = sum(map(WEIGHTED_LOG2.__getitem__, map(feedbacks.count, POSSIBLE_FEEDBACK_KEYS)))
+
+    # Clamp rounding noise when every code gives the same feedback
+    return max((WEIGHTED_LOG2[total_codes] - weighted) / total_codes, 0.0)
+
+def entropy_upper_bound(total_codes: int) -> float:
+    """
+    Highest entropy any guess can reach for a number of remaining codes.
+    
+    Args:
+        total_codes (int): Number of remaining possible secret codes
+        
+    Returns:
+        float: log2(min(total_codes, NUM_POSSIBLE_FEEDBACKS)), less a small
+        tolerance for rounding
+        
+    Note:
+        No guess can split the codes into more than NUM_POSSIBLE_FEEDBACKS
+        groups, so no guess can have more entropy than this.
+    """
+    return math.log2(min(total_codes, NUM_POSSIBLE_FEEDBACKS)) - 1e-10
+
+def search_guess_range(possible_ids: List[int], feedback_table: List[bytes],
+                       start: int, stop: int) -> Tuple[int, float]:
+    """
+    Find the best guess among the guess ids in range(start, stop).
+    
+    Args:
+        possible_ids (List[int]): Ids of the remaining possible secret codes
+        feedback_table (List[bytes]): Table built by build_feedback_table
+        start (int): First guess id to evaluate
+        stop (int): Guess id to stop before
+        
+    Returns:
+        Tuple[int, float]: Id of the best guess in the range and its Σ c * log2(c)
+        over feedback group sizes c, the quantity the search minimizes
+        
+    Note:
+        All guesses are evaluated in one batch: the columns of the remaining
+        codes are sliced out of every table row with a single itemgetter, so
+        no per-guess work happens in Python bytecode. Ties go to the lowest id,
+        and the search stops at the first guess reaching entropy_upper_bound.
+        
+        The loop inlines calculate_entropy with every global it uses bound to
+        a local. Since entropy is (n * log2(n) - Σ c * log2(c)) / n, the guess
+        with the smallest Σ c * log2(c) has the most entropy, so only that sum
+        is compared per guess.
+    """
+    total_codes = len(possible_ids)
+    total_weight = WEIGHTED_LOG2[total_codes]
+    weight_bound = total_weight - total_codes * entropy_upper_bound(total_codes)
+
+    # Slice the remaining codes' columns out of every row of the table
+    gather = operator.itemgetter(*possible_ids)
+    rows = itertools.islice(feedback_table, start, stop)
+    weight = WEIGHTED_LOG2.__getitem__
+    feedback_keys = POSSIBLE_FEEDBACK_KEYS
 
-    # Calculate Shannon entropy
-    entropy = 0.0
-    for count in feedback_counts.values():
-        probability = count / total_codes
-        entropy -= probability * math.log2(probability)
+    min_weighted = math.inf
+    best_guess = start
+    for guess_id, feedbacks in enumerate(map(bytes, map(gather, rows)), start):
+        weighted = sum(map(weight, map(feedbacks.count, feedback_keys)))
+        if weighted < min_weighted:
+            min_weighted = weighted
+            best_guess = guess_id
+
+            # Early stopping if no other guess can do better
+            if min_weighted <= weight_bound:
+                break
+
+    return best_guess, min_weighted
+
+# Feedback table of a search worker process, set by init_search_worker
+worker_feedback_table: List[bytes] = []
+
+def init_search_worker(feedback_table: List[bytes]) -> None:
+    """
+    Initialize a worker process of the executor from create_search_executor.
+    Workers ignore Ctrl-C; the parent handles it and shuts the pool down.
+    
+    Args:
+        feedback_table (List[bytes]): Table built by build_feedback_table
+    """
+    global worker_feedback_table
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    worker_feedback_table = feedback_table
+
+def search_guess_range_in_worker(possible_ids: List[int], start: int, stop: int) -> Tuple[int, float]:
+    """
+    search_guess_range against the table of the current worker process.
+    
+    Args:
+        possible_ids (List[int]): Ids of the remaining possible secret codes
+        start (int): First guess id to evaluate
+        stop (int): Guess id to stop before
+        
+    Returns:
+        Tuple[int, float]: Same as search_guess_range
+    """
+    return search_guess_range(possible_ids, worker_feedback_table, start, stop)
 
-    return entropy
+def create_search_executor(feedback_table: List[bytes]) -> Tuple[Optional[ProcessPoolExecutor], int]:
+    """
+    Start one search worker process per CPU core this process may run on,
+    up to MAX_SEARCH_WORKERS.
+    
+    Args:
+        feedback_table (List[bytes]): Table the workers search
+        
+    Returns:
+        Tuple[Optional[ProcessPoolExecutor], int]: The worker pool and its
+        number of workers, or (None, 1) if only one core is usable or the
+        platform is not Linux
+        
+    Note:
+        Workers are forked so they share the parent's copy of the 25 MB table.
+        Under spawn or forkserver the table would be pickled to every worker,
+        and starting two workers took ~160-180ms, as long as the searches they
+        would speed up. Forking is only safe by default on Linux; macOS made
+        spawn the default because forked children can crash there.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        num_cores = len(os.sched_getaffinity(0))
+    else:
+        num_cores = os.cpu_count() or 1
+    num_workers = min(num_cores, MAX_SEARCH_WORKERS)
+    if num_workers < 2 or not sys.platform.startswith('linux'):
+        return None, 1
+    executor = ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context('fork'),
+                                   initializer=init_search_worker, initargs=(feedback_table,))
+    return executor, num_workers
 
-def find_best_guess(possible_codes: List[str], all_codes: List[str]) -> Tuple[str, float]:
+def find_trivial_guess(possible_ids: List[int]) -> Optional[Tuple[int, float]]:
+    """
+    Answer the positions whose best guess is known without a search.
+    
+    Args:
+        possible_ids (List[int]): Ids of the remaining possible secret codes
+        
+    Returns:
+        Optional[Tuple[int, float]]: Id of the best guess and its expected
+        information gain, or None if a search is needed
+    """
+    # Nothing has been learned yet, so the opening move is fixed
+    total_codes = len(possible_ids)
+    if total_codes == NUM_CODES:
+        return OPENING_GUESS, OPENING_ENTROPY
+
+    # With at most two codes left, guessing one of them is optimal: it
+    # either wins or tells them apart, and it may win outright
+    if total_codes <= 2:
+        return possible_ids[0], float(total_codes - 1)
+
+    return None
+
+def find_best_guess(possible_ids: List[int], feedback_table: List[bytes],
+                    executor: Optional[ProcessPoolExecutor] = None,
+                    num_workers: int = 1) -> Tuple[int, float]:
     """
     Find the optimal guess that maximizes expected information gain.
     Considers all possible codes as guesses, not just the remaining possibilities.
     
     Args:
-        possible_codes (List[str]): List of remaining possible secret codes
-        all_codes (List[str]): List of all valid codes that can be guessed
+        possible_ids (List[int]): Ids of the remaining possible secret codes
+        feedback_table (List[bytes]): Table built by build_feedback_table
+        executor (Optional[ProcessPoolExecutor]): Pool from create_search_executor
+            to spread large searches over, or None to search in-process
+        num_workers (int): Number of workers in executor, as returned by
+            create_search_executor
         
     Returns:
-        Tuple[str, float]: The best guess and its expected information gain
+        Tuple[int, float]: Id of the best guess and its expected information gain
         
     Note:
-        Uses an optimization where it stops searching if maximum possible
-        entropy is achieved (log2 of number of possibilities).
+        A parallel search splits the guess ids into one contiguous range per
+        worker and merges the ranges' weighted sums in id order with the same
+        comparisons as search_guess_range, so it picks the same guess as
+        searching in-process.
     """
-    max_entropy = -1
-    best_guess = possible_codes[0]
+    trivial_guess = find_trivial_guess(possible_ids)
+    if trivial_guess is not None:
+        return trivial_guess
+
+    total_codes = len(possible_ids)
+    gather = operator.itemgetter(*possible_ids)
+    if executor is None or total_codes < PARALLEL_MIN_CODES:
+        best_guess, _ = search_guess_range(possible_ids, feedback_table, 0, NUM_CODES)
+        return best_guess, calculate_entropy(bytes(gather(feedback_table[best_guess])))
+
+    # One range per worker of the pool
+    bounds = [NUM_CODES * worker // num_workers for worker in range(num_workers + 1)]
+    futures = [executor.submit(search_guess_range_in_worker, possible_ids, start, stop)
+               for start, stop in zip(bounds, bounds[1:])]
+    weight_bound = WEIGHTED_LOG2[total_codes] - total_codes * entropy_upper_bound(total_codes)
+
+    min_weighted = math.inf
+    best_guess = possible_ids[0]
+    for future in futures:
+        guess_id, weighted = future.result()
+        if weighted < min_weighted:
+            min_weighted = weighted
+            best_guess = guess_id
 
-    # Evaluate each possible guess
-    for guess in all_codes:
-        entropy = calculate_entropy(possible_codes, guess)
-        if entropy > max_entropy:
-            max_entropy = entropy
-            best_guess = guess
+            # Later ranges cannot do better; drop any not yet started
+            if min_weighted <= weight_bound:
+                for pending in futures:
+                    pending.cancel()
+                break
 
-        # Early stopping if we've found optimal entropy
-        if abs(max_entropy - math.log2(len(possible_codes))) < 1e-10:
-            break
+    return best_guess, calculate_entropy(bytes(gather(feedback_table[best_guess])))
+
+def candidate_signature(possible_ids: List[int]) -> str:
+    """
+    Compute a compact fingerprint of a set of remaining codes.
+    
+    Args:
+        possible_ids (List[int]): Sorted ids of the remaining possible codes
+        
+    Returns:
+        str: 128-bit BLAKE2b digest of the ids, as hex
+    """
+    return hashlib.blake2b(array('H', possible_ids).tobytes(), digest_size=16).hexdigest()
 
-    return best_guess, max_entropy
+def load_guess_cache() -> Dict[str, Tuple[int, float]]:
+    """
+    Load best guesses persisted by earlier games.
+    
+    Returns:
+        Dict[str, Tuple[int, float]]: Best guess id and entropy by candidate_signature,
+        empty if no usable cache file exists
+        
+    Note:
+        The cache is plain JSON mapping each signature to [guess_id, entropy],
+        so loading a tampered file cannot run code. A file of any other shape
+        is ignored.
+    """
+    try:
+        with open(GUESS_CACHE_PATH, 'rb') as cache_file:
+            data = json.load(cache_file)
+        if not isinstance(data, dict):
+            return {}
+        guess_cache = {}
+        for signature, (guess_id, entropy) in data.items():
+            if type(guess_id) is not int or not 0 <= guess_id < NUM_CODES:
+                return {}
+            guess_cache[signature] = (guess_id, float(entropy))
+        return guess_cache
+    except (OSError, ValueError, TypeError):
+        return {}
+
+def save_guess_cache(guess_cache: Dict[str, Tuple[int, float]]) -> None:
+    """
+    Persist best guesses so later games can skip the search.
+    Failing to write the cache is not an error; the game simply runs uncached.
+    
+    Args:
+        guess_cache (Dict[str, Tuple[int, float]]): Cache to write
+    """
+    write_cache_file(GUESS_CACHE_PATH, json.dumps(guess_cache).encode())
+    remove_stale_cache_files(GUESS_CACHE_PATH)
+
+def find_best_guess_cached(possible_ids: List[int], feedback_table: List[bytes],
+                           guess_cache: Dict[str, Tuple[int, float]],
+                           executor: Optional[ProcessPoolExecutor] = None,
+                           num_workers: int = 1) -> Tuple[int, float]:
+    """
+    Memoized find_best_guess backed by a cache persisted across games.
+    
+    Args:
+        possible_ids (List[int]): Ids of the remaining possible secret codes
+        feedback_table (List[bytes]): Table built by build_feedback_table
+        guess_cache (Dict[str, Tuple[int, float]]): Cache from load_guess_cache
+        executor (Optional[ProcessPoolExecutor]): Passed on to find_best_guess
+        num_workers (int): Passed on to find_best_guess
+        
+    Returns:
+        Tuple[int, float]: Id of the best guess and its expected information gain
+        
+    Note:
+        The solver is deterministic, so the candidate sets it can reach form a
+        fixed decision tree; the cache is bounded by that tree's size. The
+        second move, the most expensive search, is a cache hit whenever an
+        earlier game got the same feedback to the opening guess. Positions
+        answered by find_trivial_guess are never cached.
+    """
+    trivial_guess = find_trivial_guess(possible_ids)
+    if trivial_guess is not None:
+        return trivial_guess
+
+    signature = candidate_signature(possible_ids)
+    if signature not in guess_cache:
+        guess_cache[signature] = find_best_guess(possible_ids, feedback_table, executor, num_workers)
+        save_guess_cache(guess_cache)
+    return guess_cache[signature]
 
 def main() -> None:
     """
@@ -147,9 +607,11 @@ def main() -> None:
     - Validates user feedback
     - Detects contradictions in feedback
     """
-    # Generate all possible 4-digit codes with unique digits
-    all_codes = [''.join(p) for p in itertools.permutations('0123456789', 4)]
-    possible_codes = all_codes.copy()
+    # Every code is possible at first; the solver works on code ids and
+    # only formats a code as a string to show it
+    possible_ids = list(range(NUM_CODES))
+    feedback_table = load_feedback_table()
+    guess_cache = load_guess_cache()
 
     # Display game instructions
     print("Think of a 4-digit number with unique digits.")
@@ -157,47 +619,54 @@ def main() -> None:
     print("Bulls: correct digit in correct position")
     print("Cows: correct digit in wrong position\n")
 
-    attempts = 0
+    executor, num_workers = create_search_executor(feedback_table)
+    try:
+        attempts = 0
 
-    # Main game loop
-    while True:
-        attempts += 1
-        # Calculate and display current game state
-        current_entropy = math.log2(len(possible_codes)) if possible_codes else 0
-        print(f"\nCurrent entropy: {current_entropy:.4f} bits")
-        print(f"Possible codes remaining: {len(possible_codes)}")
+        # Main game loop
+        while True:
+            attempts += 1
+            # Calculate and display current game state
+            current_entropy = math.log2(len(possible_ids)) if possible_ids else 0
+            print(f"\nCurrent entropy: {current_entropy:.4f} bits")
+            print(f"Possible codes remaining: {len(possible_ids)}")
 
-        # Find and make the best guess
-        guess, expected_entropy = find_best_guess(possible_codes, all_codes)
-        print(f"\nAttempt {attempts}: Computer guesses {guess}")
-        print(f"Expected information gain: {expected_entropy:.4f} bits")
+            # Find and make the best guess
+            guess_id, expected_entropy = find_best_guess_cached(possible_ids, feedback_table, guess_cache,
+                                                                   executor, num_workers)
+            guess = format_code(guess_id)
+            print(f"\nAttempt {attempts}: Computer guesses {guess}")
+            print(f"Expected information gain: {expected_entropy:.4f} bits")
 
-        # Get and validate user feedback
-        while True:
-            try:
-                feedback = input("Enter feedback as 'Bulls Cows' (or 'win' if correct): ").strip().lower()
-                if feedback == 'win':
-                    print(f"\nComputer won in {attempts} attempts!")
-                    return
-                bulls, cows = map(int, feedback.split())
-                if 0 <= bulls <= 4 and 0 <= cows <= 4 and bulls + cows <= 4:
-                    break
-                print("Invalid feedback. Bulls and cows should be between 0 and 4, and their sum ≤ 4.")
-            except ValueError:
-                print("Invalid input. Please enter two numbers separated by space, or 'win'.")
-
-        # Update possible codes based on feedback
-        possible_codes = filter_codes(possible_codes, guess, bulls, cows)
-
-        # Check for contradictions or solution
-        if not possible_codes:
-            print("Error: No possible codes remain. Please check your feedback.")
-            return
-
-        if len(possible_codes) == 1:
-            print(f"\nOnly one possibility remains: {possible_codes[0]}")
-            print("This must be your number!")
-            return
+            # Get and validate user feedback
+            while True:
+                try:
+                    feedback = input("Enter feedback as 'Bulls Cows' (or 'win' if correct): ").strip().lower()
+                    if feedback == 'win':
+                        print(f"\nComputer won in {attempts} attempts!")
+                        return
+                    bulls, cows = map(int, feedback.split())
+                    if 0 <= bulls <= 4 and 0 <= cows <= 4 and bulls + cows <= 4:
+                        break
+                    print("Invalid feedback. Bulls and cows should be between 0 and 4, and their sum ≤ 4.")
+                except ValueError:
+                    print("Invalid input. Please enter two numbers separated by space, or 'win'.")
+
+            # Update possible codes based on feedback
+            possible_ids = filter_codes(possible_ids, feedback_table[guess_id], bulls, cows)
+
+            # Check for contradictions or solution
+            if not possible_ids:
+                print("Error: No possible codes remain. Please check your feedback.")
+                return
+
+            if len(possible_ids) == 1:
+                print(f"\nOnly one possibility remains: {format_code(possible_ids[0])}")
+                print("This must be your number!")
+                return
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
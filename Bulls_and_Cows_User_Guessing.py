@@ -10,6 +10,9 @@ import math
 import random
 from typing import List, Tuple
 
+# Maximum possible entropy for a 4-digit number
+BASE_ENTROPY = 4 * math.log2(10)
+
 def compute_feedback(secret: str, guess: str) -> Tuple[int, int]:
     """
     Compute the feedback for a guess in terms of bulls and cows.
@@ -54,9 +57,6 @@ def calculate_current_entropy(bulls: int, cows: int) -> float:
         - Total initial entropy for 4 positions is 13.29 bits
         - Bulls provide more certainty than cows in reducing entropy
     """
-    # Maximum possible entropy for a 4-digit number
-    base_entropy = 4 * math.log2(10)  
-
     # Convert feedback into uncertainty reduction factors
     position_certainty = bulls / 4.0  # Each bull gives complete position certainty
     digit_certainty = cows / 8.0      # Cows provide less certainty than bulls
@@ -65,7 +65,7 @@ def calculate_current_entropy(bulls: int, cows: int) -> float:
     remaining_uncertainty = 1.0 - (position_certainty + digit_certainty)
 
     # Apply uncertainty to base entropy
-    current_entropy = base_entropy * remaining_uncertainty
+    current_entropy = BASE_ENTROPY * remaining_uncertainty
 
     return current_entropy
 
@@ -109,7 +109,7 @@ def main() -> None:
     secret_code = random.choice(all_codes)
 
     # Calculate initial entropy for a 4-digit number
-    initial_entropy = 4 * math.log2(10)
+    initial_entropy = BASE_ENTROPY
 
     # Display game instructions
     print("I've thought of a 4-digit number with unique digits.")